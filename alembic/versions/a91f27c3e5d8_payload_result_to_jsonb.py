@@ -0,0 +1,47 @@
+"""payload and result to jsonb
+
+Revision ID: a91f27c3e5d8
+Revises: bdba4813760c
+Create Date: 2026-08-30 09:41:17.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91f27c3e5d8'
+down_revision: Union[str, Sequence[str], None] = 'bdba4813760c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'jobs', 'payload',
+        type_=postgresql.JSONB(),
+        postgresql_using='payload::jsonb',
+    )
+    op.alter_column(
+        'jobs', 'result',
+        type_=postgresql.JSONB(),
+        postgresql_using='result::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'jobs', 'result',
+        type_=sa.Text(),
+        postgresql_using='result::text',
+    )
+    op.alter_column(
+        'jobs', 'payload',
+        type_=sa.JSON(),
+        postgresql_using='payload::json',
+    )
@@ -0,0 +1,45 @@
+"""list_jobs composite indexes
+
+Revision ID: c7e48b19d2a4
+Revises: a91f27c3e5d8
+Create Date: 2026-08-30 11:05:44.209175
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e48b19d2a4'
+down_revision: Union[str, Sequence[str], None] = 'a91f27c3e5d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # list_jobs filters by status and orders by created_at DESC; this
+    # lets the planner walk the index and stop at LIMIT instead of
+    # filtering then sorting the whole status partition
+    op.create_index(
+        'ix_jobs_status_created_at',
+        'jobs',
+        ['status', sa.text('created_at DESC')],
+    )
+    # Partial index over just the queued jobs (priority 1 = highest,
+    # so ascending) for next-job lookups; tiny because it only ever
+    # contains the current backlog
+    op.create_index(
+        'ix_jobs_queued_priority',
+        'jobs',
+        ['status', 'priority', 'created_at'],
+        postgresql_where=sa.text("status = 'QUEUED'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_queued_priority', table_name='jobs')
+    op.drop_index('ix_jobs_status_created_at', table_name='jobs')
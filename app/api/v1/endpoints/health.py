@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -8,16 +11,16 @@ from app.core.redis_client import get_redis, RedisClient
 
 router = APIRouter()
 
+# Probes (Kubernetes, load balancers) hit /health every few seconds per
+# replica; serving a result up to 2s old keeps them from hammering the
+# database and Redis without changing what liveness means.
+_HEALTH_CACHE_TTL = 2.0
+_health_cache: tuple[float, dict] = (0.0, {})
+_health_lock = asyncio.Lock()
 
-@router.get("/health")
-async def health_check(
-    db: AsyncSession = Depends(get_db), redis: RedisClient = Depends(get_redis)
-):
-    """
-    Health check endpoint.
 
-    Returns service health status.
-    """
+async def _run_health_checks(db: AsyncSession, redis: RedisClient) -> dict:
+    """Run the actual database and Redis probes."""
     # Check database
     try:
         await db.execute(text("SELECT 1"))
@@ -36,3 +39,30 @@ async def health_check(
         redis_status = f"unhealthy: {str(e)}"
 
     return {"status": "ok", "database": db_status, "redis": redis_status}
+
+
+@router.get("/health")
+async def health_check(
+    db: AsyncSession = Depends(get_db), redis: RedisClient = Depends(get_redis)
+):
+    """
+    Health check endpoint.
+
+    Returns service health status, cached for a couple of seconds so
+    frequent probes don't translate into backend load.
+    """
+    global _health_cache
+
+    checked_at, result = _health_cache
+    if time.monotonic() - checked_at < _HEALTH_CACHE_TTL:
+        return result
+
+    async with _health_lock:
+        # Another request may have refreshed while we waited
+        checked_at, result = _health_cache
+        if time.monotonic() - checked_at < _HEALTH_CACHE_TTL:
+            return result
+
+        result = await _run_health_checks(db, redis)
+        _health_cache = (time.monotonic(), result)
+        return result
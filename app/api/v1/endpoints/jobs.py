@@ -1,5 +1,9 @@
+import time
+from collections import OrderedDict
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -10,6 +14,66 @@ from app.models.job import JobStatus, JobType
 
 router = APIRouter()
 
+# Built once at import time; constructing a TypeAdapter per request
+# would rebuild the validation schema on every call.
+_JOB_ADAPTER = TypeAdapter(JobResponse)
+
+
+async def _stream_job_list(jobs):
+    """Yield a JSON array one job at a time.
+
+    Serializing per item keeps peak memory at one job's worth of JSON
+    instead of the whole page, and lets the first bytes go out while
+    later rows are still being encoded.
+    """
+    yield b"["
+    first = True
+    for job in jobs:
+        if not first:
+            yield b","
+        first = False
+        validated = _JOB_ADAPTER.validate_python(job, from_attributes=True)
+        yield _JOB_ADAPTER.dump_json(validated)
+    yield b"]"
+
+
+# Clients poll GET /jobs/{id} until completion, but a job's state only
+# changes a handful of times. Non-terminal results are served from this
+# cache for a short window; only COMPLETED truly never changes, so only
+# it is served until evicted by size pressure. FAILED is not terminal
+# here - POST /{id}/retry moves it back to QUEUED, and the retry can
+# land on another API worker whose cache we can't invalidate - so it
+# gets the short TTL like any other status.
+_IMMUTABLE_STATUSES = frozenset({JobStatus.COMPLETED})
+_JOB_CACHE: OrderedDict[str, tuple[float, JobResponse]] = OrderedDict()
+_JOB_CACHE_TTL = 0.25  # seconds, for anything that can still change
+_JOB_CACHE_MAX = 10_000
+
+
+def _job_cache_get(job_id: str) -> Optional[JobResponse]:
+    """Return a cached response if still valid, else None."""
+    entry = _JOB_CACHE.get(job_id)
+    if entry is None:
+        return None
+
+    cached_at, response = entry
+    if response.status in _IMMUTABLE_STATUSES:
+        _JOB_CACHE.move_to_end(job_id)
+        return response
+    if time.monotonic() - cached_at < _JOB_CACHE_TTL:
+        return response
+
+    del _JOB_CACHE[job_id]
+    return None
+
+
+def _job_cache_put(response: JobResponse) -> None:
+    """Cache a job response, evicting the oldest entry when full."""
+    _JOB_CACHE[response.id] = (time.monotonic(), response)
+    _JOB_CACHE.move_to_end(response.id)
+    while len(_JOB_CACHE) > _JOB_CACHE_MAX:
+        _JOB_CACHE.popitem(last=False)
+
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
@@ -42,13 +106,20 @@ async def get_job(
     db: AsyncSession = Depends(get_db),
 ):
     """get job by id."""
+    cached = _job_cache_get(job_id)
+    if cached is not None:
+        return cached
+
     job = await JobService.get_job(db, job_id)
 
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
-    return job
+
+    response = JobResponse.model_validate(job)
+    _job_cache_put(response)
+    return response
 
 
 @router.get("/", response_model=List[JobResponse])
@@ -71,7 +142,10 @@ async def list_jobs(
     jobs = await JobService.list_jobs(
         db, status=status_filter, job_type=type_filter, skip=skip, limit=limit
     )
-    return jobs
+
+    # Returning a Response skips FastAPI's response_model re-validation;
+    # rows are validated exactly once as the stream is produced.
+    return StreamingResponse(_stream_job_list(jobs), media_type="application/json")
 
 
 @router.post("/{job_id}/retry", response_model=JobResponse)
@@ -89,6 +163,10 @@ async def retry_job(
     """
     job = await JobService.retry_job(db, redis, job_id)
 
+    # Drop this process's cached FAILED entry right away; other
+    # workers age theirs out within the short TTL
+    _JOB_CACHE.pop(job_id, None)
+
     if not job:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -115,24 +193,20 @@ async def get_job_stats(
     return stats
 
 
-@router.post("/batch", response_model=List[JobResponse])
-async def create_jobs_batch(
+@router.post("/bulk", response_model=List[JobResponse])
+async def create_jobs_bulk(
     jobs: List[JobCreate],
     db: AsyncSession = Depends(get_db),
     redis: RedisClient = Depends(get_redis),
 ):
     """
-    Create multiple jobs in batch.
+    Create multiple jobs in bulk.
 
     Maximum 100 jobs per request.
     """
     if len(jobs) > 100:
-        raise HTTPException(status_code=400, detail="Maximum 100 jobs per batch")
-
-    created_jobs = []
+        raise HTTPException(status_code=400, detail="Maximum 100 jobs per request")
 
-    for job_in in jobs:
-        job = await JobService.create_job(db, redis, job_in)
-        created_jobs.append(job)
+    created_jobs = await JobService.create_jobs_bulk(db, redis, jobs)
 
     return created_jobs
@@ -66,7 +66,11 @@ class Settings(BaseSettings):
     JOB_QUEUE_NAME: str = "jobs:queue"
     JOB_PROCESSING_NAME: str = "jobs:processing"
     JOB_DLQ_NAME: str = "jobs:dlq"  # Dead Letter Queue
+    JOB_DELAYED_SET: str = "jobs:delayed"  # Retries waiting out their backoff
     JOB_RESULT_TTL: int = 3600  # 1 hour
+    STATS_CACHE_TTL: int = 10  # seconds
+    JOB_STALE_TIMEOUT: int = 300  # seconds before a claimed job is reaped
+    REAPER_INTERVAL: int = 60  # seconds between reaper scans
 
     # Retry Configuration
     MAX_RETRIES: int = 3
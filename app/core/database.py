@@ -14,6 +14,13 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Hot-path queries (get/update/retry by id) repeat the same SQL
+    # shape thousands of times per second; a larger asyncpg prepared-
+    # statement cache keeps Postgres from re-parsing them on every call
+    connect_args={
+        "statement_cache_size": 500,
+        "prepared_statement_cache_size": 500,
+    },
 )
 
 # Create async session factory
@@ -0,0 +1,44 @@
+"""Server-side Lua scripts for atomic queue transitions.
+
+Claiming a job is handled natively by BLMOVE (blocking pop + push to
+the processing list in one command); Lua cannot block, so only the
+acknowledge side needs a script. ACK_JOB removes the claimed payload
+from the processing list and, when the job's outcome requires it,
+pushes a follow-up payload (retry or dead-letter) to a target queue in
+the same atomic step - the job is never observable as both in-flight
+and requeued, or as neither. PROMOTE_DELAYED drains due retries from
+the delayed sorted set onto the main queue, again in one round-trip.
+"""
+
+# KEYS[1]: processing list
+# KEYS[2]: target queue or delayed set for a follow-up push
+#          (ignored when ARGV[2] is empty)
+# ARGV[1]: claimed payload to remove from the processing list
+# ARGV[2]: payload to push to KEYS[2], or '' for a plain acknowledge
+# ARGV[3]: score for a delayed (ZADD) push, or '' for an immediate RPUSH
+ACK_JOB = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+if ARGV[2] ~= '' then
+    if ARGV[3] ~= '' then
+        redis.call('ZADD', KEYS[2], ARGV[3], ARGV[2])
+    else
+        redis.call('RPUSH', KEYS[2], ARGV[2])
+    end
+end
+return 1
+"""
+
+# KEYS[1]: delayed set (scored by the epoch time each payload is due)
+# KEYS[2]: destination queue
+# ARGV[1]: current epoch time
+# ARGV[2]: max payloads to promote per call
+PROMOTE_DELAYED = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, item in ipairs(due) do
+    redis.call('RPUSH', KEYS[2], item)
+end
+if #due > 0 then
+    redis.call('ZREM', KEYS[1], unpack(due))
+end
+return #due
+"""
@@ -23,12 +23,22 @@ job_retry_counter = Counter(
     "jobs_retried_total", "Total number of job retries", ["job_type"]
 )
 
-# Queue metrics
-queue_depth_gauge = Gauge("queue_depth", "Current depth of job queue")
+# Queue metrics. Maintained incrementally at the enqueue/claim/ack
+# sites rather than polled with LLEN; see app.core.redis_client
+queue_depth_gauge = Gauge(
+    "queue_depth", "Current depth of job queues", ["queue"]
+)
 
 # Worker metrics
 active_workers_gauge = Gauge("active_workers", "Number of active workers")
 
+# Redis connection pool metrics
+redis_pool_in_use_gauge = Gauge(
+    "redis_pool_connections_in_use",
+    "Redis connections currently checked out, per pool",
+    ["pool"],
+)
+
 worker_jobs_processed = Counter(
     "worker_jobs_processed_total",
     "Total jobs processed by workers",
@@ -58,20 +68,22 @@ def track_job_duration(job_type: str):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Monotonic clock: immune to NTP steps that make wall-clock
+            # deltas negative or wildly wrong
+            start_time = time.monotonic()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 job_duration_histogram.labels(job_type=job_type).observe(duration)
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 job_duration_histogram.labels(job_type=job_type).observe(duration)
                 raise e
 
-            return wrapper
+        return wrapper
 
-        return decorator
+    return decorator
 
 
 def track_api_call(endpoint: Callable):
@@ -87,16 +99,16 @@ def track_api_call(endpoint: Callable):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.monotonic()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 api_request_duration.labels(method="POST", endpoint=endpoint).observe(
                     duration
                 )
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 api_request_duration.labels(method="POST", endpoint=endpoint).observe(
                     duration
                 )
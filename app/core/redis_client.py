@@ -1,9 +1,45 @@
-import asyncio
-import json
+import time
+from contextlib import asynccontextmanager
 from typing import Optional, Any
+import msgpack
+import orjson
 from redis.asyncio import Redis, ConnectionPool
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError
 
 from app.core.config import settings
+from app.core.lua_scripts import ACK_JOB, PROMOTE_DELAYED
+from app.core.metrics import queue_depth_gauge, redis_pool_in_use_gauge
+
+# Queue wire-format version prefix. Bump when the payload encoding
+# changes so old and new workers can coexist during a rollout.
+_MSGPACK_V1 = b"\x01"
+
+# Cached queue_depth_gauge children (labels() re-hashes per call)
+_QUEUE_DEPTH_GAUGES: dict[str, Any] = {}
+
+
+def _queue_depth(queue_name: str):
+    gauge = _QUEUE_DEPTH_GAUGES.get(queue_name)
+    if gauge is None:
+        gauge = _QUEUE_DEPTH_GAUGES[queue_name] = queue_depth_gauge.labels(
+            queue=queue_name
+        )
+    return gauge
+
+
+def track_queue_depth(queue_name: str, delta: int = 1):
+    """Adjust the in-process depth gauge for a queue.
+
+    The gauge is bookkept at push/pop sites instead of polling LLEN on
+    every scrape; periodic reconciliation snaps out any drift.
+    """
+    _queue_depth(queue_name).inc(delta)
+
+
+def set_queue_depth(queue_name: str, value: int):
+    """Overwrite the in-process depth gauge for a queue."""
+    _queue_depth(queue_name).set(value)
 
 
 class RedisClient:
@@ -11,17 +47,61 @@ class RedisClient:
 
     def __init__(self):
         self.pool: Optional[ConnectionPool] = None
+        self.queue_pool: Optional[ConnectionPool] = None
         self.redis: Optional[Redis] = None
+        self.queue_redis: Optional[Redis] = None
+        self._locks: dict[str, Lock] = {}
+        self._ack_job_script = None
+        self._promote_delayed_script = None
+
+    @staticmethod
+    def pack_job(job_data: dict) -> bytes:
+        """Serialize a queue payload (versioned MessagePack)."""
+        return _MSGPACK_V1 + msgpack.packb(job_data, use_bin_type=True)
+
+    @staticmethod
+    def unpack_job(raw: bytes) -> dict:
+        """Deserialize a queue payload, tolerating the legacy JSON format."""
+        if raw.startswith(_MSGPACK_V1):
+            return msgpack.unpackb(raw[1:], raw=False)
+        # Jobs enqueued before the msgpack switch are plain JSON
+        return orjson.loads(raw)
 
     async def connect(self):
-        """Create Redis connection pool."""
+        """Create Redis connection pools.
+
+        Blocking queue consumers (BLMOVE/BLPOP) hold their connection
+        for the full block timeout, so they get a dedicated pool; cache
+        and metadata traffic (locks, counters, stats, health pings)
+        stays latency-sensitive on its own pool and can never be
+        starved by parked consumers.
+        """
+        # The health check interval recycles connections that went stale
+        # behind NAT/LB idle timeouts instead of paying a reconnect RTT
+        # mid-request.
+        self.queue_pool = ConnectionPool.from_url(
+            str(settings.REDIS_URL),
+            decode_responses=False,
+            max_connections=settings.WORKER_CONCURRENCY + 2,
+            health_check_interval=30,
+        )
         self.pool = ConnectionPool.from_url(
             str(settings.REDIS_URL),
-            encoding="utf-8",
-            decode_responses=True,
-            max_connections=100,  # Increase from 50
+            decode_responses=False,
+            max_connections=max(200, settings.WORKER_CONCURRENCY * 4),
+            health_check_interval=30,
         )
+        self.queue_redis = Redis(connection_pool=self.queue_pool)
         self.redis = Redis(connection_pool=self.pool)
+        self._ack_job_script = self.redis.register_script(ACK_JOB)
+        self._promote_delayed_script = self.redis.register_script(PROMOTE_DELAYED)
+
+        redis_pool_in_use_gauge.labels(pool="queue").set_function(
+            lambda: len(self.queue_pool._in_use_connections)
+        )
+        redis_pool_in_use_gauge.labels(pool="cache").set_function(
+            lambda: len(self.pool._in_use_connections)
+        )
 
         # Test connection
         await self.redis.ping()
@@ -31,8 +111,12 @@ class RedisClient:
         """Close Redis connection."""
         if self.redis:
             await self.redis.close()
+        if self.queue_redis:
+            await self.queue_redis.close()
         if self.pool:
             await self.pool.disconnect()
+        if self.queue_pool:
+            await self.queue_pool.disconnect()
         print("✓ Redis disconnected")
 
     # Queue Operations
@@ -47,8 +131,34 @@ class RedisClient:
         Returns:
             Queue length after enqueue
         """
-        job_json = json.dumps(job_data)
-        return await self.redis.rpush(queue_name, job_json)
+        length = await self.redis.rpush(queue_name, self.pack_job(job_data))
+        track_queue_depth(queue_name)
+        return length
+
+    async def enqueue_many(self, queue_name: str, jobs_data: list[dict]) -> int:
+        """
+        Add multiple jobs to queue in a single round-trip.
+
+        All pushes are sent in one pipeline, so N jobs cost one
+        network round-trip instead of N.
+
+        Args:
+            queue_name: Queue name
+            jobs_data: List of job data dictionaries
+
+        Returns:
+            Queue length after the last enqueue
+        """
+        if not jobs_data:
+            return await self.redis.llen(queue_name)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_data in jobs_data:
+                pipe.rpush(queue_name, self.pack_job(job_data))
+            results = await pipe.execute()
+
+        track_queue_depth(queue_name, len(jobs_data))
+        return results[-1]
 
     async def dequeue(self, queue_name: str, timeout: int = 1) -> Optional[dict]:
         """
@@ -61,12 +171,103 @@ class RedisClient:
         Returns:
             Job data or None
         """
-        result = await self.redis.blpop(queue_name, timeout=timeout)
+        result = await self.queue_redis.blpop(queue_name, timeout=timeout)
         if result:
-            _, job_json = result
-            return json.loads(job_json)
+            _, job_raw = result
+            track_queue_depth(queue_name, -1)
+            return self.unpack_job(job_raw)
         return None
 
+    async def claim_job(
+        self, queue_name: str, processing_name: str, timeout: int = 5
+    ) -> Optional[tuple[bytes, dict]]:
+        """
+        Atomically move the next job from the queue to a processing list.
+
+        BLMOVE pops and parks the payload in one server-side step, so a
+        worker crash can't lose the job: it stays in the processing list
+        until acknowledged.
+
+        Args:
+            queue_name: Source queue
+            processing_name: In-flight (processing) list
+            timeout: Block timeout in seconds
+
+        Returns:
+            (raw payload, job data) or None on timeout
+        """
+        raw = await self.queue_redis.blmove(
+            queue_name, processing_name, timeout, "LEFT", "RIGHT"
+        )
+        if raw is None:
+            return None
+        track_queue_depth(queue_name, -1)
+        track_queue_depth(processing_name)
+        return raw, self.unpack_job(raw)
+
+    async def ack_job(
+        self,
+        processing_name: str,
+        raw_job: bytes,
+        requeue_to: Optional[str] = None,
+        requeue_data: Optional[dict] = None,
+        requeue_score: Optional[float] = None,
+    ):
+        """
+        Acknowledge a claimed job, optionally requeueing in the same step.
+
+        Runs the ACK_JOB Lua script: one round-trip that removes the
+        payload from the processing list and, if requested, pushes the
+        follow-up payload atomically - RPUSH to a queue (DLQ,
+        immediate retry) or, when requeue_score is given, ZADD to the
+        delayed set scored by when the payload is due.
+
+        Args:
+            processing_name: In-flight list the job was claimed into
+            raw_job: Raw payload returned by claim_job
+            requeue_to: Queue or delayed set for a follow-up push, if any
+            requeue_data: Payload for the follow-up push
+            requeue_score: Epoch time the payload becomes due (delayed push)
+        """
+        push_raw = self.pack_job(requeue_data) if requeue_data is not None else b""
+        await self._ack_job_script(
+            keys=[processing_name, requeue_to or processing_name],
+            args=[raw_job, push_raw, "" if requeue_score is None else requeue_score],
+        )
+        track_queue_depth(processing_name, -1)
+        if requeue_data is not None and requeue_to is not None:
+            track_queue_depth(requeue_to)
+
+    async def promote_delayed(
+        self, delayed_set: str, queue_name: str, limit: int = 100
+    ) -> int:
+        """
+        Move due payloads from the delayed set onto a queue.
+
+        Single atomic round-trip (Lua): payloads whose score has
+        passed are pushed to the queue and removed from the set.
+
+        Args:
+            delayed_set: Sorted set of delayed payloads
+            queue_name: Destination queue
+            limit: Max payloads to promote per call
+
+        Returns:
+            Number of payloads promoted
+        """
+        promoted = await self._promote_delayed_script(
+            keys=[delayed_set, queue_name],
+            args=[time.time(), limit],
+        )
+        if promoted:
+            track_queue_depth(delayed_set, -promoted)
+            track_queue_depth(queue_name, promoted)
+        return promoted
+
+    async def processing_jobs(self, processing_name: str) -> list[bytes]:
+        """Snapshot the raw payloads currently sitting in a processing list."""
+        return await self.redis.lrange(processing_name, 0, -1)
+
     async def queue_length(self, queue_name: str) -> int:
         """Get queue length."""
         return await self.redis.llen(queue_name)
@@ -84,7 +285,7 @@ class RedisClient:
         Returns:
             True if successful
         """
-        value_json = json.dumps(value)
+        value_json = orjson.dumps(value)
         if expire:
             return await self.redis.setex(key, expire, value_json)
         return await self.redis.set(key, value_json)
@@ -93,9 +294,46 @@ class RedisClient:
         """Get value by key."""
         value = await self.redis.get(key)
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
 
+    async def mget_json(self, keys: list[str]) -> list[Optional[Any]]:
+        """
+        Get multiple values in a single round-trip.
+
+        Args:
+            keys: Redis keys
+
+        Returns:
+            List of deserialized values (None for missing keys)
+        """
+        if not keys:
+            return []
+        values = await self.redis.mget(keys)
+        return [orjson.loads(value) if value else None for value in values]
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False):
+        """
+        Context manager yielding a Redis pipeline.
+
+        Lets callers batch several commands into one round-trip:
+
+            async with redis.pipeline() as pipe:
+                pipe.llen("jobs:queue")
+                pipe.llen("jobs:dlq")
+                queue_len, dlq_len = await pipe.execute()
+        """
+        async with self.redis.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
+    async def queue_lengths(self, queue_names: list[str]) -> list[int]:
+        """Get the lengths of multiple queues in one round-trip."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for queue_name in queue_names:
+                pipe.llen(queue_name)
+            return await pipe.execute()
+
     async def delete(self, key: str) -> int:
         """Delete key."""
         return await self.redis.delete(key)
@@ -121,24 +359,29 @@ class RedisClient:
         """
         lock_key = f"lock:{lock_name}"
 
-        if blocking_timeout:
-            # Blocking acquire
-            import time
+        lock = Lock(self.redis, lock_key, timeout=timeout, sleep=0.01)
+        acquired = await lock.acquire(
+            blocking=blocking_timeout is not None,
+            blocking_timeout=blocking_timeout,
+        )
 
-            end_time = time.time() + blocking_timeout
-            while time.time() < end_time:
-                if await self.redis.set(lock_key, "1", nx=True, ex=timeout):
-                    return True
-                await asyncio.sleep(0.1)
-            return False
-        else:
-            # Non-blocking acquire
-            return await self.redis.set(lock_key, "1", nx=True, ex=timeout)
+        if acquired:
+            self._locks[lock_name] = lock
+
+        return acquired
 
     async def release_lock(self, lock_name: str):
         """Release distributed lock."""
-        lock_key = f"lock:{lock_name}"
-        await self.redis.delete(lock_key)
+        lock = self._locks.pop(lock_name, None)
+
+        if lock is None:
+            return
+
+        try:
+            await lock.release()
+        except LockError:
+            # Lock expired before release; nothing to clean up
+            pass
 
 
 # Global instance
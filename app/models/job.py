@@ -1,6 +1,7 @@
 from typing import Optional
 from datetime import datetime
-from sqlalchemy import Integer, Text, DateTime, Enum as SQLEnum, JSON
+from sqlalchemy import Index, Integer, Text, DateTime, Enum as SQLEnum, desc, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
@@ -32,6 +33,19 @@ class Job(BaseModel):
     """Job model for tracking async jobs."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Matches list_jobs: WHERE status ORDER BY created_at DESC
+        Index("ix_jobs_status_created_at", "status", desc("created_at")),
+        # Partial index over the queued backlog for next-job lookups
+        # (priority 1 = highest, so ascending)
+        Index(
+            "ix_jobs_queued_priority",
+            "status",
+            "priority",
+            "created_at",
+            postgresql_where=text("status = 'QUEUED'"),
+        ),
+    )
 
     job_type: Mapped[JobType] = mapped_column(
         SQLEnum(JobType), nullable=False, index=True
@@ -41,9 +55,11 @@ class Job(BaseModel):
         SQLEnum(JobStatus), default=JobStatus.PENDING, nullable=False, index=True
     )
 
-    # Job metadata
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
-    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Job metadata. JSONB transfers natively over asyncpg's binary
+    # protocol - no Python-side dumps/loads round-trip - and supports
+    # indexing into the document server-side
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Retry logic
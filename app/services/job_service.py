@@ -1,11 +1,14 @@
+import uuid
 from typing import Optional
 from datetime import datetime, timezone
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func
 
 from app.models.job import Job, JobStatus, JobType
 from app.schemas.job import JobCreate, JobUpdate, JobStats
-from app.core.redis_client import RedisClient
+from app.core.redis_client import RedisClient, set_queue_depth, track_queue_depth
 from app.core.config import settings
 from app.core.metrics import (
     job_created_counter,
@@ -13,6 +16,51 @@ from app.core.metrics import (
 )
 
 
+# Stats are cached briefly in Redis; bump the version when JobStats
+# changes shape so stale cached payloads are ignored after a deploy.
+_STATS_CACHE_KEY = "jobs:stats:v1"
+
+# Batches above this size are inserted with COPY instead of executemany
+# (below the bulk endpoint's 100-job cap, so the path is reachable)
+_COPY_THRESHOLD = 50
+
+# Bound metric children once at import; .labels() re-hashes the label
+# values on every call, which adds up at thousands of jobs per second
+_CREATED_COUNTERS = {
+    job_type: job_created_counter.labels(job_type=job_type.value)
+    for job_type in JobType
+}
+_COMPLETED_COUNTERS = {
+    (job_type, status): job_completed_counter.labels(
+        job_type=job_type.value, status=status.value
+    )
+    for job_type in JobType
+    for status in (JobStatus.COMPLETED, JobStatus.FAILED)
+}
+
+
+def _status_count_key(status: JobStatus) -> str:
+    """Redis key holding the live count of jobs in a status."""
+    return f"jobs:count:{status.value}"
+
+
+async def _shift_status_counts(
+    redis: RedisClient,
+    old_status: Optional[JobStatus],
+    new_status: Optional[JobStatus],
+    amount: int = 1,
+):
+    """Atomically move `amount` jobs between two status counters."""
+    if old_status == new_status:
+        return
+    async with redis.pipeline(transaction=True) as pipe:
+        if old_status is not None:
+            pipe.decrby(_status_count_key(old_status), amount)
+        if new_status is not None:
+            pipe.incrby(_status_count_key(new_status), amount)
+        await pipe.execute()
+
+
 class JobService:
     """Service for managing jobs."""
 
@@ -41,9 +89,9 @@ class JobService:
         db.add(job)
         await db.flush()
         await db.refresh(job)
-        job_created_counter.labels(job_type=job_in.job_type.value).inc()
+        _CREATED_COUNTERS[job_in.job_type].inc()
 
-        # Enqueue job in Redis
+        # Enqueue job and bump the queued counter in one round-trip
         job_data = {
             "id": job.id,
             "job_type": job.job_type.value,
@@ -52,16 +100,126 @@ class JobService:
             "retry_count": 0,
         }
 
-        await redis.enqueue(settings.JOB_QUEUE_NAME, job_data)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(settings.JOB_QUEUE_NAME, RedisClient.pack_job(job_data))
+            pipe.incr(_status_count_key(JobStatus.QUEUED))
+            await pipe.execute()
+        track_queue_depth(settings.JOB_QUEUE_NAME)
 
         return job
 
+    @staticmethod
+    async def create_jobs_bulk(
+        db: AsyncSession, redis: RedisClient, jobs_in: list[JobCreate]
+    ):
+        """
+        Create and enqueue multiple jobs in one batch.
+
+        IDs and timestamps are generated up front so the Redis enqueue
+        never needs a RETURNING round-trip. Small batches go through
+        the ORM with a single flush; batches above _COPY_THRESHOLD use
+        Postgres COPY via the raw asyncpg connection, which checks
+        locks/permissions/types once for the whole batch instead of
+        per statement. All queue pushes go out in one Redis pipeline,
+        so the cost is O(1) round-trips instead of O(N).
+
+        Args:
+            db: Database session
+            redis: Redis client
+            jobs_in: List of job creation data
+
+        Returns:
+            List of created jobs
+        """
+        now = datetime.utcnow()
+        jobs = [
+            Job(
+                id=str(uuid.uuid4()),
+                job_type=job_in.job_type,
+                status=JobStatus.QUEUED,
+                payload=job_in.payload,
+                priority=job_in.priority,
+                scheduled_at=job_in.scheduled_at,
+                retry_count=0,
+                max_retries=settings.MAX_RETRIES,
+                created_at=now,
+                updated_at=now,
+            )
+            for job_in in jobs_in
+        ]
+
+        if len(jobs) > _COPY_THRESHOLD:
+            # COPY bypasses SQLAlchemy's bind conversion, so enums must
+            # be the Postgres labels - SQLEnum creates them from the
+            # member names ('QUEUED'), not the values ('queued')
+            records = [
+                (
+                    job.id,
+                    job.job_type.name,
+                    job.status.name,
+                    orjson.dumps(job.payload).decode(),
+                    job.priority,
+                    job.scheduled_at,
+                    job.retry_count,
+                    job.max_retries,
+                    job.created_at,
+                    job.updated_at,
+                )
+                for job in jobs
+            ]
+            raw = await (await db.connection()).get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                "jobs",
+                records=records,
+                columns=[
+                    "id",
+                    "job_type",
+                    "status",
+                    "payload",
+                    "priority",
+                    "scheduled_at",
+                    "retry_count",
+                    "max_retries",
+                    "created_at",
+                    "updated_at",
+                ],
+            )
+        else:
+            db.add_all(jobs)
+            await db.flush()
+
+        for job in jobs:
+            _CREATED_COUNTERS[job.job_type].inc()
+
+        jobs_data = [
+            {
+                "id": job.id,
+                "job_type": job.job_type.value,
+                "payload": job.payload,
+                "priority": job.priority,
+                "retry_count": 0,
+            }
+            for job in jobs
+        ]
+
+        async with redis.pipeline(transaction=True) as pipe:
+            for job_data in jobs_data:
+                pipe.rpush(settings.JOB_QUEUE_NAME, RedisClient.pack_job(job_data))
+            pipe.incrby(_status_count_key(JobStatus.QUEUED), len(jobs_data))
+            await pipe.execute()
+        track_queue_depth(settings.JOB_QUEUE_NAME, len(jobs_data))
+
+        return jobs
+
     @staticmethod
     async def get_job(db: AsyncSession, job_id: str):
-        """Get job by ID."""
+        """Get job by ID.
 
-        result = await db.execute(select(Job).where(Job.id == job_id))
-        return result.scalar_one_or_none()
+        session.get() checks the identity map first and uses the
+        cached primary-key lookup statement, skipping per-call
+        compilation.
+        """
+        return await db.get(Job, job_id)
 
     @staticmethod
     async def list_jobs(
@@ -97,29 +255,52 @@ class JobService:
         return list(result.scalars().all())
 
     @staticmethod
-    async def update_job(db: AsyncSession, job_id: str, job_update: JobUpdate):
+    async def update_job(
+        db: AsyncSession,
+        job_id: str,
+        job_update: JobUpdate,
+        redis: Optional[RedisClient] = None,
+    ):
         """Update job status and result."""
 
-        result = await db.execute(select(Job).where(Job.id == job_id))
-        job = result.scalar_one_or_none()
+        update_data = job_update.model_dump(exclude_unset=True)
 
-        if not job:
+        if job_update.status in [JobStatus.COMPLETED, JobStatus.FAILED]:
+            update_data["completed_at"] = datetime.now(timezone.utc)
+        elif job_update.status == JobStatus.PROCESSING:
+            # Only stamp started_at on the first transition to PROCESSING
+            update_data["started_at"] = func.coalesce(
+                Job.started_at, datetime.now(timezone.utc)
+            )
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE +
+        # refresh; the self-join subquery also returns the pre-update
+        # status so the Redis counters can be shifted without an extra
+        # read.
+        current = (
+            select(Job.id.label("job_pk"), Job.status.label("old_status"))
+            .where(Job.id == job_id)
+            .subquery()
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id == current.c.job_pk)
+            .values(**update_data)
+            .returning(Job, current.c.old_status)
+        )
+
+        row = (await db.execute(stmt)).first()
+
+        if row is None:
             return None
 
-        update_job = job_update.model_dump(exclude_unset=True)
-        for field, value in update_job.items():
-            setattr(job, field, value)
+        job, old_status = row
 
         if job_update.status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-            job.completed_at = datetime.now(timezone.utc)
-            job_completed_counter.labels(
-                job_type=job.job_type.value, status=job_update.status.value
-            ).inc()
-        elif job_update.status == JobStatus.PROCESSING and not job.started_at:
-            job.started_at = datetime.now(timezone.utc)
+            _COMPLETED_COUNTERS[(job.job_type, job_update.status)].inc()
 
-        await db.flush()
-        await db.refresh(job)
+        if redis is not None and job_update.status is not None:
+            await _shift_status_counts(redis, old_status, job_update.status)
 
         return job
 
@@ -128,16 +309,28 @@ class JobService:
         """
         Get job statistics.
 
+        The computed result is cached in Redis for STATS_CACHE_TTL
+        seconds so dashboard polling doesn't re-aggregate the jobs
+        table on every request.
+
         Returns:
             Job statistics
         """
-        # Count by status
-        status_counts = {}
-        for status in JobStatus:
-            result = await db.execute(
-                select(func.count(Job.id)).where(Job.status == status)
-            )
-            status_counts[status.value] = result.scalar() or 0
+        cached = await redis.get(_STATS_CACHE_KEY)
+        if cached:
+            return JobStats(**cached)
+
+        # Read the live per-status counters in one MGET instead of
+        # aggregating the jobs table; the reconciliation task corrects
+        # any drift from the GROUP BY ground truth once a minute.
+        statuses = list(JobStatus)
+        values = await redis.mget_json(
+            [_status_count_key(status) for status in statuses]
+        )
+        status_counts = {
+            status.value: max(value or 0, 0)
+            for status, value in zip(statuses, values)
+        }
 
         total = sum(status_counts.values())
         completed = status_counts.get(JobStatus.COMPLETED.value, 0)
@@ -146,9 +339,13 @@ class JobService:
         total_finished = completed + failed
         success_rate = (completed / total_finished * 100) if total_finished > 0 else 0.0
 
+        # One LLEN per cache TTL, not per request; it also corrects the
+        # in-process depth gauge, which can't see dequeues happening in
+        # the worker process
         queue_depth = await redis.queue_length(settings.JOB_QUEUE_NAME)
+        set_queue_depth(settings.JOB_QUEUE_NAME, queue_depth)
 
-        return JobStats(
+        stats = JobStats(
             total_jobs=total,
             pending=status_counts.get(JobStatus.PENDING.value, 0),
             queued=status_counts.get(JobStatus.QUEUED.value, 0),
@@ -159,6 +356,12 @@ class JobService:
             success_rate=round(success_rate, 2),
         )
 
+        await redis.set(
+            _STATS_CACHE_KEY, stats.model_dump(), expire=settings.STATS_CACHE_TTL
+        )
+
+        return stats
+
     @staticmethod
     async def retry_job(db: AsyncSession, redis: RedisClient, job_id: str):
         """
@@ -172,24 +375,33 @@ class JobService:
         Returns:
             Updated job or None
         """
-        result = await db.execute(select(Job).where(Job.id == job_id))
-        job = result.scalar_one_or_none()
+        # Check-and-requeue in one atomic statement: the status and
+        # retry-count guards live in the WHERE clause, so a job that a
+        # worker picks up concurrently can't be requeued twice, and the
+        # old SELECT + UPDATE pair collapses into a single round-trip.
+        stmt = (
+            update(Job)
+            .where(
+                Job.id == job_id,
+                Job.status == JobStatus.FAILED,
+                Job.retry_count < Job.max_retries,
+            )
+            .values(
+                status=JobStatus.QUEUED,
+                retry_count=Job.retry_count + 1,
+                error=None,
+            )
+            .returning(Job)
+        )
 
-        if not job or job.status != JobStatus.FAILED:
-            return None
+        result = await db.execute(stmt)
+        job = result.scalar_one_or_none()
 
-        if job.retry_count >= job.max_retries:
+        if not job:
             return None
 
-        # Update job status
-        job.status = JobStatus.QUEUED
-        job.retry_count += 1
-        job.error = None
-
-        await db.flush()
-        await db.refresh(job)
-
-        # Re-enqueue
+        # Re-enqueue and shift the failed -> queued counters in the
+        # same round-trip
         job_data = {
             "id": job.id,
             "job_type": job.job_type.value,
@@ -198,6 +410,32 @@ class JobService:
             "retry_count": job.retry_count,
         }
 
-        await redis.enqueue(settings.JOB_QUEUE_NAME, job_data)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(settings.JOB_QUEUE_NAME, RedisClient.pack_job(job_data))
+            pipe.decrby(_status_count_key(JobStatus.FAILED), 1)
+            pipe.incr(_status_count_key(JobStatus.QUEUED))
+            await pipe.execute()
+        track_queue_depth(settings.JOB_QUEUE_NAME)
 
         return job
+
+    @staticmethod
+    async def reconcile_status_counters(db: AsyncSession, redis: RedisClient):
+        """
+        Overwrite the Redis status counters from the database.
+
+        The incremental INCR/DECR bookkeeping can drift (crashed
+        workers, manual surgery); running the GROUP BY ground truth
+        periodically snaps the counters back.
+        """
+        result = await db.execute(
+            select(Job.status, func.count(Job.id)).group_by(Job.status)
+        )
+        counts = {status: 0 for status in JobStatus}
+        for status, count in result.all():
+            counts[status] = count
+
+        async with redis.pipeline(transaction=True) as pipe:
+            for status, count in counts.items():
+                pipe.set(_status_count_key(status), count)
+            await pipe.execute()
@@ -1,6 +1,9 @@
 import asyncio
 import logging
 import signal
+
+import uvloop
+
 from app.core.redis_client import redis_client
 from app.workers.worker import WorkerPool
 
@@ -32,7 +35,7 @@ async def main():
         await redis_client.connect()
 
         # Create and start worker pool
-        worker_pool = WorkerPool(redis_client, num_workers=5)
+        worker_pool = WorkerPool(redis_client)
         await worker_pool.start()
 
         # Keep running until shutdown signal or interrupt
@@ -58,5 +61,7 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Run main loop
+    # Run main loop on uvloop (libuv-backed, much faster async I/O
+    # dispatch than the default pure-Python loop)
+    uvloop.install()
     asyncio.run(main())
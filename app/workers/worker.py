@@ -1,14 +1,18 @@
 import time
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
-from app.core.redis_client import RedisClient
-from app.models.job import JobStatus
+from app.core.redis_client import RedisClient, set_queue_depth
 from app.services.job_service import JobService
+from app.models.job import Job, JobStatus, JobType
 from app.schemas.job import JobUpdate
+from app.workers.status_batcher import StatusBatcher
 from app.workers.task_handlers import TaskHandlers
 from app.core.metrics import (
     worker_jobs_processed,
@@ -19,74 +23,89 @@ from app.core.metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Bound metric children, cached once: .labels() re-hashes its
+# arguments on every call, a per-job cost worth skipping. Job types
+# arrive as strings off the wire, so key by value.
+_RETRY_COUNTERS = {
+    job_type.value: job_retry_counter.labels(job_type=job_type.value)
+    for job_type in JobType
+}
+_DURATION_HISTOGRAMS = {
+    job_type.value: job_duration_histogram.labels(job_type=job_type.value)
+    for job_type in JobType
+}
 
-class AsyncWorker:
-    """Async worker for processing tasks from Redis queue."""
 
-    def __init__(self, worker_id: int, redis_client: RedisClient, concurrency: int = 1):
+class AsyncWorker:
+    """Consumer worker: processes jobs handed to it by the pool dispatcher.
+
+    Workers no longer talk to the queue directly - the pool's single
+    dispatcher claims jobs and feeds them through a bounded inbox, so
+    only one Redis connection ever sits blocked on the queue no matter
+    how many consumers run.
+    """
+
+    def __init__(
+        self,
+        worker_id: int,
+        redis_client: RedisClient,
+        inbox: asyncio.Queue,
+        status_batcher: Optional[StatusBatcher] = None,
+    ):
         """
         Initialize worker.
 
         Args:
             worker_id: Unique worker identifier
             redis_client: Redis client instance
-            concurrency: Number of concurrent jobs this worker can handle
+            inbox: Queue of claimed jobs fed by the pool dispatcher
+            status_batcher: Batcher for non-critical status transitions
         """
         self.worker_id = worker_id
         self.redis = redis_client
-        self.concurrency = concurrency
+        self.inbox = inbox
+        self.status_batcher = status_batcher
         self.running = False
-        self.active_tasks = set()
+        self._completed_counter = worker_jobs_processed.labels(
+            worker_id=str(worker_id), status="completed"
+        )
         active_workers_gauge.inc()
 
     async def start(self):
-        """Start the worker."""
+        """Consume claimed jobs from the inbox until stopped."""
         self.running = True
-        logger.info(
-            f"Worker {self.worker_id} started with concurrency={self.concurrency}"
-        )
         while self.running:
             try:
-                # Check if we have capacity
-                if len(self.active_tasks) >= self.concurrency:
-                    await asyncio.sleep(0.1)
-
-                # Try to get job from queue
-                job_data = await self.redis.dequeue(
-                    settings.JOB_QUEUE_NAME, timeout=settings.WORKER_POLL_INTERVAL
+                # Short timeout so the loop notices a stop request
+                raw_job, job_data = await asyncio.wait_for(
+                    self.inbox.get(), timeout=1
                 )
+            except asyncio.TimeoutError:
+                continue
 
-                if job_data:
-                    # Create task for processing
-                    task = asyncio.create_task(self._process_job(job_data))
-                    self.active_tasks.add(task)
-                    task.add_done_callback(self.active_tasks.discard)
-
+            try:
+                await self._process_job(raw_job, job_data)
             except Exception as e:
                 logger.error(f"Worker {self.worker_id} error: {e}")
-                await asyncio.sleep(1)
+            finally:
+                self.inbox.task_done()
 
     async def stop(self):
         """Stop worker gracefully"""
-        logger.info(f"Worker {self.worker_id} stopping...")
         self.running = False
         active_workers_gauge.dec()
 
-        # Wait for active task to complete
-        if self.active_tasks:
-            logger.info(
-                f"Waiting for {len(self.active_tasks)} active tasks to complete"
-            )
-            await asyncio.gather(*self.active_tasks, return_exceptions=True)
-
-        logger.info(f"Worker {self.worker_id} stopped")
-
-    async def _process_job(self, job_data: dict):
+    async def _process_job(self, raw_job: bytes, job_data: dict):
         """
-        Process a single job.
+        Process a single claimed job.
+
+        The claim (BLMOVE) already guarantees exclusive delivery, so no
+        distributed lock is needed; the job sits in the processing list
+        until acknowledged.
 
         Args:
-            job_data: Job data from queue
+            raw_job: Raw claimed payload (needed for the acknowledge)
+            job_data: Decoded job data
         """
         job_id = job_data.get("id")
         job_type = job_data.get("job_type")
@@ -95,23 +114,40 @@ class AsyncWorker:
 
         logger.info(f"Worker {self.worker_id} processing job {job_id} ({job_type})")
 
+        # Follow-up push to perform atomically with the acknowledge
+        requeue_to = None
+        requeue_data = None
+        requeue_score = None
+
         # Get database session
         async with AsyncSessionLocal() as db:
             try:
-                # Aquire distributed lock to prevent duplicate processing
-                lock_name = f"job:{job_id}"
-                lock_acquired = await self.redis.acquire_lock(lock_name, timeout=300)
-
-                if not lock_acquired:
-                    logger.warning(f"Could not acquire locak for jon {job_id}")
-                    return
-
                 try:
-                    # Update job status to PROCESSING
-                    await JobService.update_job(
-                        db, job_id, JobUpdate(status=JobStatus.PROCESSING)
-                    )
-                    await db.commit()
+                    # Record the PROCESSING transition. Nothing depends
+                    # on it being visible immediately, so it goes through
+                    # the batcher (one bulk UPDATE per tick) when one is
+                    # available instead of a dedicated commit per job.
+                    # The expected old status feeds the batcher's guard:
+                    # first attempts come from QUEUED, retries from
+                    # RETRYING (the failure path sets it before the
+                    # payload re-enters the queue).
+                    if self.status_batcher is not None:
+                        old_status = (
+                            JobStatus.QUEUED
+                            if retry_count == 0
+                            else JobStatus.RETRYING
+                        )
+                        await self.status_batcher.submit(
+                            job_id, old_status, JobStatus.PROCESSING
+                        )
+                    else:
+                        await JobService.update_job(
+                            db,
+                            job_id,
+                            JobUpdate(status=JobStatus.PROCESSING),
+                            redis=self.redis,
+                        )
+                        await db.commit()
 
                     # Get handler for job type
                     handler = TaskHandlers.get_handler(job_type)
@@ -119,19 +155,21 @@ class AsyncWorker:
                     if not handler:
                         raise ValueError(f"No handler for job type: {job_type}")
 
-                    # Execute job
-                    start_time = time.time()
+                    # Execute job (monotonic clock: wall-clock steps
+                    # would skew the duration histogram)
+                    start_time = time.monotonic()
                     result = await handler(payload)
-                    duration = time.time() - start_time
+                    duration = time.monotonic() - start_time
 
-                    job_duration_histogram.labels(job_type=job_type).observe(duration)
-                    worker_jobs_processed.labels(
-                        worker_id=str(self.worker_id), status="completed"
-                    ).inc()
+                    _DURATION_HISTOGRAMS[job_type].observe(duration)
+                    self._completed_counter.inc()
 
                     # Update job status to COPLETED
                     await JobService.update_job(
-                        db, job_id, JobUpdate(status=JobStatus.COMPLETED, result=result)
+                        db,
+                        job_id,
+                        JobUpdate(status=JobStatus.COMPLETED, result=result),
+                        redis=self.redis,
                     )
                     await db.commit()
 
@@ -142,12 +180,16 @@ class AsyncWorker:
 
                     # Check if we should retry
                     if retry_count < settings.MAX_RETRIES:
-                        # Re-enqueue for retry
-                        await self._retry_job(job_data, str(job_error))
+                        # Park in the delayed set until the backoff
+                        # elapses; the slot frees immediately
+                        requeue_to, requeue_data, requeue_score = self._retry_job(
+                            job_data, str(job_error)
+                        )
                         await JobService.update_job(
                             db,
                             job_id,
                             JobUpdate(status=JobStatus.RETRYING, error=str(job_error)),
+                            redis=self.redis,
                         )
 
                     else:
@@ -156,31 +198,52 @@ class AsyncWorker:
                             db,
                             job_id,
                             JobUpdate(status=JobStatus.FAILED, error=str(job_error)),
+                            redis=self.redis,
                         )
 
-                        # Move to daed letter queue
-                        await self._move_to_dlq(job_data, str(job_error))
+                        # Move to dead letter queue
+                        requeue_to, requeue_data = self._move_to_dlq(
+                            job_data, str(job_error)
+                        )
 
                     await db.commit()
 
                 finally:
-                    # Release lock
-                    await self.redis.release_lock(lock_name)
+                    # Acknowledge and (for retry/DLQ outcomes) requeue in
+                    # one atomic server-side step
+                    await self.redis.ack_job(
+                        settings.JOB_PROCESSING_NAME,
+                        raw_job,
+                        requeue_to=requeue_to,
+                        requeue_data=requeue_data,
+                        requeue_score=requeue_score,
+                    )
 
             except Exception as e:
                 logger.error(f"Critical error processing job {job_id}: {e}")
 
-    async def _retry_job(self, job_data: dict, error: str):
+    def _retry_job(self, job_data: dict, error: str) -> tuple[str, dict, float]:
         """
-        Re-enqueue job for retry with exponential backoff.
+        Prepare a job for retry with exponential backoff.
+
+        Instead of sleeping out the backoff in the worker (which would
+        pin a slot idle for up to RETRY_DELAY * 2^retries seconds),
+        the payload goes into the delayed sorted set scored by its due
+        time; the pool's promotion loop moves it back onto the queue
+        once the backoff elapses, and it survives worker restarts.
 
         Args:
             job_data: Original job data
             error: Error message
+
+        Returns:
+            (delayed set, job data, due time) push for the caller to flush
         """
         retry_count = job_data.get("retry_count", 0) + 1
         delay = settings.RETRY_DELAY * (2 ** (retry_count - 1))  # Exponential backoff
-        job_retry_counter.labels(job_type=job_type).inc()
+        retry_counter = _RETRY_COUNTERS.get(job_data["job_type"])
+        if retry_counter is not None:
+            retry_counter.inc()
 
         logger.info(
             f"Retrying job {job_data['id']} "
@@ -188,73 +251,246 @@ class AsyncWorker:
             f"after {delay}s delay"
         )
 
-        # Wait for backoff period
-        await asyncio.sleep(delay)
-
-        # Re-enqueue
         job_data["retry_count"] = retry_count
-        await self.redis.enqueue(settings.JOB_QUEUE_NAME, job_data)
+        return (settings.JOB_DELAYED_SET, job_data, time.time() + delay)
 
-    async def _move_to_dlq(self, job_data: dict, error: str):
+    def _move_to_dlq(self, job_data: dict, error: str) -> tuple[str, dict]:
         """
-        Move failed job to dead letter queue.
+        Prepare a failed job for the dead letter queue.
 
         Args:
             job_data: Job data
             error: Error message
+
+        Returns:
+            (queue name, job data) push for the caller to flush
         """
         logger.warning(f"Moving job {job_data['id']} to DLQ: {error}")
         dlq_data = {
             **job_data,
             "error": error,
-            "failed_at": datetime.utcnow().isoformat(),
+            "failed_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        await self.redis.enqueue(settings.JOB_DLQ_NAME, dlq_data)
+        return (settings.JOB_DLQ_NAME, dlq_data)
 
 
 class WorkerPool:
-    """Pool of async workers."""
+    """Pool of consumer workers fed by a single queue dispatcher."""
 
-    def __init__(self, redis_client: RedisClient, num_workers: int = 5):
+    def __init__(self, redis_client: RedisClient):
         """
         Initialize worker pool.
 
         Args:
             redis_client: Redis client instance
-            num_workers: Number of workers in the pool
         """
         self.redis = redis_client
-        self.num_workers = num_workers
+        # Floored at 1 so a low concurrency setting can never silently
+        # disable throughput (the old per-worker division could)
+        self.total_concurrency = max(1, settings.WORKER_CONCURRENCY)
+        # Bounded inbox: once 2x concurrency jobs are claimed but not
+        # yet picked up, the dispatcher blocks instead of hoarding the
+        # queue away from other worker processes
+        self._inbox: asyncio.Queue = asyncio.Queue(
+            maxsize=self.total_concurrency * 2
+        )
+        self.running = False
         self.workers = []
         self.worker_tasks = []
+        self.background_tasks = []
+        self._dispatcher_task = None
+        self.status_batcher = StatusBatcher(redis_client)
 
     async def start(self):
-        """Start all workers."""
-        logger.info(f"Starting worker pool with {self.num_workers} workers")
+        """Start the dispatcher and all consumer workers."""
+        logger.info(
+            f"Starting worker pool with concurrency={self.total_concurrency}"
+        )
+
+        await self.status_batcher.start()
 
-        for i in range(self.num_workers):
+        for i in range(self.total_concurrency):
             worker = AsyncWorker(
                 worker_id=i,
                 redis_client=self.redis,
-                concurrency=settings.WORKER_CONCURRENCY // self.num_workers,
+                inbox=self._inbox,
+                status_batcher=self.status_batcher,
             )
             self.workers.append(worker)
 
             task = asyncio.create_task(worker.start())
             self.worker_tasks.append(task)
 
+        self.running = True
+        self._dispatcher_task = asyncio.create_task(self._dispatcher_loop())
+
+        self.background_tasks.append(
+            asyncio.create_task(self._reconcile_counters_loop())
+        )
+        self.background_tasks.append(
+            asyncio.create_task(self._reap_stale_jobs_loop())
+        )
+        self.background_tasks.append(
+            asyncio.create_task(self._promote_delayed_loop())
+        )
+
         logger.info("Worker pool started")
 
+    async def _dispatcher_loop(self):
+        """Claim jobs from Redis and hand them to the consumers.
+
+        One task blocks on the queue for the whole pool, so the pool
+        holds a single parked Redis connection instead of one per
+        consumer. BLMOVE atomically moves the payload to the
+        processing list, so a crash between claim and ack can't lose
+        the job.
+        """
+        while self.running:
+            try:
+                claimed = await self.redis.claim_job(
+                    settings.JOB_QUEUE_NAME,
+                    settings.JOB_PROCESSING_NAME,
+                    timeout=5,
+                )
+                if claimed:
+                    await self._inbox.put(claimed)
+            except Exception as e:
+                logger.error(f"Dispatcher error: {e}")
+                await asyncio.sleep(1)
+
+    async def _promote_delayed_loop(self, interval: float = 0.5):
+        """Move due retries from the delayed set back onto the queue.
+
+        Each pass is one atomic Lua round-trip (ZRANGEBYSCORE + RPUSH
+        + ZREM), so a payload can't be promoted twice even with
+        several worker processes running this loop.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.redis.promote_delayed(
+                    settings.JOB_DELAYED_SET, settings.JOB_QUEUE_NAME
+                )
+            except Exception as e:
+                logger.error(f"Delayed-job promotion failed: {e}")
+
+    async def _reap_stale_jobs_loop(self, interval: int = settings.REAPER_INTERVAL):
+        """Requeue jobs stranded in the processing list by dead workers.
+
+        Claimed payloads sit in the processing list until acknowledged;
+        if a worker process dies mid-job, its payloads stay there
+        forever. Each pass scans the list, checks when each job last
+        touched the database, and requeues anything idle longer than
+        JOB_STALE_TIMEOUT through the atomic ack script, so a job is
+        never observable as both in-flight and requeued.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._reap_stale_jobs()
+            except Exception as e:
+                logger.error(f"Stale-job reaper failed: {e}")
+
+    async def _reap_stale_jobs(self):
+        raws = await self.redis.processing_jobs(settings.JOB_PROCESSING_NAME)
+        if not raws:
+            return
+
+        jobs_by_id = {}
+        for raw in raws:
+            try:
+                job_data = RedisClient.unpack_job(raw)
+                jobs_by_id[job_data["id"]] = (raw, job_data)
+            except Exception:
+                logger.warning("Skipping undecodable processing-list payload")
+
+        if not jobs_by_id:
+            return
+
+        # A job is stale when nothing has written to its row for the
+        # whole timeout: either the claim never reached PROCESSING
+        # (worker died immediately) or it did and then went silent.
+        # RETRYING counts too - a claimed retry sits at RETRYING until
+        # its PROCESSING write lands, and a worker can die before that.
+        # A genuinely slow job can be reaped too - delivery is
+        # at-least-once and handlers must tolerate reprocessing.
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_TIMEOUT)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Job.id).where(
+                    Job.id.in_(jobs_by_id),
+                    Job.status.in_(
+                        [
+                            JobStatus.QUEUED,
+                            JobStatus.PROCESSING,
+                            JobStatus.RETRYING,
+                        ]
+                    ),
+                    Job.updated_at < cutoff,
+                )
+            )
+            stale_ids = [row[0] for row in result.all()]
+
+        for job_id in stale_ids:
+            raw, job_data = jobs_by_id[job_id]
+            logger.warning(f"Reaping stale job {job_id} back onto the queue")
+            await self.redis.ack_job(
+                settings.JOB_PROCESSING_NAME,
+                raw,
+                requeue_to=settings.JOB_QUEUE_NAME,
+                requeue_data=job_data,
+            )
+
+    async def _reconcile_counters_loop(self, interval: int = 60):
+        """Periodically snap counters and depth gauges to ground truth.
+
+        The queue-depth gauge is bookkept incrementally at push/pop
+        sites; pushes from other processes (and any missed updates)
+        drift it, so each pass overwrites it from the real lengths.
+        """
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await JobService.reconcile_status_counters(db, self.redis)
+
+                queue_names = [
+                    settings.JOB_QUEUE_NAME,
+                    settings.JOB_PROCESSING_NAME,
+                    settings.JOB_DLQ_NAME,
+                ]
+                lengths = await self.redis.queue_lengths(queue_names)
+                for queue_name, length in zip(queue_names, lengths):
+                    set_queue_depth(queue_name, length)
+                delayed = await self.redis.redis.zcard(settings.JOB_DELAYED_SET)
+                set_queue_depth(settings.JOB_DELAYED_SET, delayed)
+            except Exception as e:
+                logger.error(f"Counter reconciliation failed: {e}")
+            await asyncio.sleep(interval)
+
     async def stop(self):
         """Stop all workers gracefully."""
         logger.info("Stopping worker pool...")
 
-        # Signal all workers to stop
+        # Stop claiming new jobs; the dispatcher exits within its
+        # block timeout
+        self.running = False
+        if self._dispatcher_task:
+            await self._dispatcher_task
+
+        # Let the consumers finish everything already claimed
+        await self._inbox.join()
+
         for worker in self.workers:
             await worker.stop()
 
+        for task in self.background_tasks:
+            task.cancel()
+
         # Wait for all worker tasks to complete
         await asyncio.gather(*self.worker_tasks, return_exceptions=True)
 
+        # Flush any status transitions still queued
+        await self.status_batcher.stop()
+
         logger.info("Worker pool stopped")
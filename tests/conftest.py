@@ -1,8 +1,6 @@
-import asyncio
-import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
 from app.main import app
@@ -22,30 +20,55 @@ TestingSessionLocal = async_sessionmaker(
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+@pytest_asyncio.fixture(scope="session")
+async def redis_connection():
+    """Connect Redis once for the whole session.
 
+    Tests share one loop (see asyncio_default_*_loop_scope in
+    pyproject), so a single connection pool serves every test instead
+    of paying a TCP + handshake round-trip per test function.
+    """
+    await redis_client.connect()
+    yield redis_client
+    await redis_client.disconnect()
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create clean database session for testing."""
+
+@pytest_asyncio.fixture(scope="session")
+async def setup_database():
+    """Create the schema once for the whole session."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
-    async with TestingSessionLocal() as session:
-        yield session
-        await session.rollback()
-
+    yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def db_session(setup_database) -> AsyncGenerator[AsyncSession, None]:
+    """Database session isolated by a rolled-back outer transaction.
+
+    The session joins a connection-level transaction via savepoints,
+    so commits inside endpoints only release a savepoint; rolling the
+    outer transaction back leaves the database clean without the old
+    create_all/drop_all cycle around every test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        yield session
+        await session.close()
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    db_session: AsyncSession, redis_connection
+) -> AsyncGenerator[AsyncClient, None]:
     """Create test client with overridden dependencies."""
 
     async def override_get_db():
@@ -53,19 +76,15 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
     app.dependency_overrides[get_db] = override_get_db
 
-    # Connect to Redis
-    await redis_client.connect()
-
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
         yield ac
 
-    # Disconnect Redis
-    await redis_client.disconnect()
-
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def redis_client_fixture():
+@pytest_asyncio.fixture
+def redis_client_fixture(redis_connection):
     """Provide Redis client for tests."""
-    return redis_client
+    return redis_connection
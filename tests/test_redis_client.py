@@ -0,0 +1,121 @@
+import time
+
+import fakeredis.aioredis
+import orjson
+import pytest
+import pytest_asyncio
+
+from app.core.lua_scripts import ACK_JOB, PROMOTE_DELAYED
+from app.core.redis_client import RedisClient
+
+
+@pytest_asyncio.fixture
+async def redis_stub():
+    """RedisClient backed by an in-memory fakeredis server."""
+    client = RedisClient()
+    fake = fakeredis.aioredis.FakeRedis()
+    client.redis = fake
+    client.queue_redis = fake
+    client._ack_job_script = fake.register_script(ACK_JOB)
+    client._promote_delayed_script = fake.register_script(PROMOTE_DELAYED)
+    yield client
+    await fake.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pack_unpack_round_trip():
+    """Test the versioned msgpack wire format round-trips."""
+    job_data = {
+        "id": "abc",
+        "job_type": "email",
+        "payload": {"to": "test@example.com"},
+        "priority": 5,
+        "retry_count": 0,
+    }
+
+    raw = RedisClient.pack_job(job_data)
+
+    assert raw[0:1] == b"\x01"
+    assert RedisClient.unpack_job(raw) == job_data
+
+
+@pytest.mark.asyncio
+async def test_unpack_legacy_json_payload():
+    """Test payloads from before the msgpack switch still decode."""
+    job_data = {"id": "abc", "retry_count": 1}
+
+    assert RedisClient.unpack_job(orjson.dumps(job_data)) == job_data
+
+
+@pytest.mark.asyncio
+async def test_claim_moves_job_to_processing(redis_stub: RedisClient):
+    """Test claiming parks the payload in the processing list."""
+    await redis_stub.enqueue("q", {"id": "j1"})
+
+    claimed = await redis_stub.claim_job("q", "p", timeout=1)
+
+    assert claimed is not None
+    raw, job_data = claimed
+    assert job_data == {"id": "j1"}
+    assert await redis_stub.queue_length("q") == 0
+    assert await redis_stub.processing_jobs("p") == [raw]
+
+
+@pytest.mark.asyncio
+async def test_ack_removes_claimed_job(redis_stub: RedisClient):
+    """Test a plain acknowledge clears the processing list."""
+    await redis_stub.enqueue("q", {"id": "j1"})
+    raw, _ = await redis_stub.claim_job("q", "p", timeout=1)
+
+    await redis_stub.ack_job("p", raw)
+
+    assert await redis_stub.processing_jobs("p") == []
+    assert await redis_stub.queue_length("q") == 0
+
+
+@pytest.mark.asyncio
+async def test_ack_requeues_in_same_step(redis_stub: RedisClient):
+    """Test acknowledge plus requeue lands the follow-up payload."""
+    await redis_stub.enqueue("q", {"id": "j1", "retry_count": 0})
+    raw, job_data = await redis_stub.claim_job("q", "p", timeout=1)
+    job_data["retry_count"] = 1
+
+    await redis_stub.ack_job("p", raw, requeue_to="q", requeue_data=job_data)
+
+    assert await redis_stub.processing_jobs("p") == []
+    assert await redis_stub.dequeue("q", timeout=1) == {"id": "j1", "retry_count": 1}
+
+
+@pytest.mark.asyncio
+async def test_ack_with_score_parks_in_delayed_set(redis_stub: RedisClient):
+    """Test a scored requeue goes to the delayed set, not the queue."""
+    await redis_stub.enqueue("q", {"id": "j1"})
+    raw, job_data = await redis_stub.claim_job("q", "p", timeout=1)
+
+    await redis_stub.ack_job(
+        "p",
+        raw,
+        requeue_to="delayed",
+        requeue_data=job_data,
+        requeue_score=time.time() + 60,
+    )
+
+    assert await redis_stub.processing_jobs("p") == []
+    assert await redis_stub.queue_length("q") == 0
+    assert await redis_stub.redis.zcard("delayed") == 1
+
+
+@pytest.mark.asyncio
+async def test_promote_delayed_moves_only_due_jobs(redis_stub: RedisClient):
+    """Test promotion moves due payloads and leaves future ones."""
+    due = RedisClient.pack_job({"id": "due"})
+    future = RedisClient.pack_job({"id": "future"})
+    await redis_stub.redis.zadd(
+        "delayed", {due: time.time() - 1, future: time.time() + 3600}
+    )
+
+    promoted = await redis_stub.promote_delayed("delayed", "q")
+
+    assert promoted == 1
+    assert await redis_stub.dequeue("q", timeout=1) == {"id": "due"}
+    assert await redis_stub.redis.zcard("delayed") == 1